@@ -0,0 +1,87 @@
+import os
+import logging
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Columns that determine the indicator values; a snapshot is only reused if they match exactly
+PRICE_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+class IndicatorCache:
+    """
+    On-disk snapshots of per-symbol indicator frames, so an unchanged price
+    history does not have to be recomputed on the next run.
+    """
+
+    def __init__(self, version: str, max_entries: int = 256, cache_dir: str = None):
+        if cache_dir is None:
+            # Get the absolute path to the project root
+            current_dir = os.path.dirname(os.path.abspath(__file__))
+            project_root = os.path.dirname(os.path.dirname(current_dir))
+
+            # Store snapshots next to the stock database
+            cache_dir = os.path.join(project_root, 'data', 'indicators')
+        self.cache_dir = cache_dir
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        # Snapshots written by other versions of the indicator code are never loaded
+        self.suffix = f'.v{version}.pkl'
+        self.max_entries = max_entries
+
+    def _path(self, symbol: str) -> str:
+        return os.path.join(self.cache_dir, f'{symbol}{self.suffix}')
+
+    def load(self, symbol: str, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Return the cached indicator frame for symbol if it was computed from
+        the same input columns and price history as data, otherwise None
+        """
+        path = self._path(symbol)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            snapshot = pd.read_pickle(path)
+            input_columns, cached = snapshot['input_columns'], snapshot['frame']
+        except Exception as e:
+            logger.warning(f"Discarding unreadable indicator snapshot for {symbol}: {e}")
+            return None
+
+        # The frame must have been computed from the same columns, not just the same prices
+        if input_columns != list(data.columns):
+            return None
+        if not cached.index.equals(data.index):
+            return None
+        for column in PRICE_COLUMNS:
+            if column not in cached.columns or column not in data.columns:
+                return None
+            if not np.array_equal(cached[column].to_numpy(), data[column].to_numpy()):
+                return None
+
+        # Touch the snapshot so eviction treats it as recently used
+        os.utime(path)
+        return cached
+
+    def save(self, symbol: str, data: pd.DataFrame, result: pd.DataFrame):
+        """Write the indicator frame result computed from data for symbol"""
+        try:
+            pd.to_pickle({'input_columns': list(data.columns), 'frame': result}, self._path(symbol))
+        except Exception as e:
+            logger.warning(f"Could not save indicator snapshot for {symbol}: {e}")
+
+    def evict(self):
+        """Remove snapshots of other versions and the least recently used ones beyond max_entries"""
+        try:
+            entries = []
+            for name in os.listdir(self.cache_dir):
+                path = os.path.join(self.cache_dir, name)
+                if name.endswith(self.suffix):
+                    entries.append(path)
+                else:
+                    os.remove(path)
+            entries.sort(key=os.path.getmtime, reverse=True)
+            for path in entries[self.max_entries:]:
+                os.remove(path)
+        except OSError as e:
+            logger.warning(f"Error evicting indicator snapshots: {e}")
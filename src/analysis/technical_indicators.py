@@ -1,83 +1,328 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 import numpy as np
-from ta import add_all_ta_features
-from ta.trend import MACD, SMAIndicator, EMAIndicator, ADXIndicator, VortexIndicator
-from ta.momentum import RSIIndicator, StochasticOscillator, TSIIndicator
-from ta.volatility import BollingerBands, AverageTrueRange
-from ta.volume import OnBalanceVolumeIndicator, ChaikinMoneyFlowIndicator, EaseOfMovementIndicator
+from numpy.lib.stride_tricks import sliding_window_view
+from ta.trend import VortexIndicator
+from ta.momentum import StochasticOscillator, TSIIndicator
+from ta.volume import EaseOfMovementIndicator
 import logging
+from .indicator_cache import IndicatorCache
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional; fall back to plain Python
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Bump when the indicator calculations change so cached snapshots are recomputed
+INDICATOR_VERSION = '1'
+
+# Fibonacci retracement ratios and the columns they are stored in
+_FIB = np.array([0.382, 0.5, 0.618])
+_FIB_COLUMNS = ['Fib_38.2', 'Fib_50.0', 'Fib_61.8']
+
+def _sma(x, window):
+    """Simple moving average via a cumulative sum, NaN until the window is full"""
+    out = np.full(len(x), np.nan)
+    if len(x) >= window:
+        cs = np.cumsum(x)
+        out[window - 1] = cs[window - 1]
+        out[window:] = cs[window:] - cs[:-window]
+        out[window - 1:] /= window
+    return out
+
+@njit(cache=True, nogil=True)
+def _ewm(x, alpha, min_periods):
+    """Exponential moving average matching pandas ewm(adjust=False); leading NaNs are skipped"""
+    n = x.shape[0]
+    out = np.full(n, np.nan)
+    y = np.nan
+    count = 0
+    for i in range(n):
+        if not np.isnan(x[i]):
+            if count == 0:
+                y = x[i]
+            else:
+                y = (1 - alpha) * y + alpha * x[i]
+            count += 1
+        if count >= min_periods:
+            out[i] = y
+    return out
+
+def _ema(x, window):
+    return _ewm(x, 2.0 / (window + 1), window)
+
+def _rsi(close, window=14):
+    """Relative Strength Index with Wilder smoothing of gains and losses"""
+    diff = np.empty_like(close)
+    diff[:1] = 0.0
+    np.subtract(close[1:], close[:-1], out=diff[1:])
+    up = _ewm(np.maximum(diff, 0.0), 1.0 / window, window)
+    down = _ewm(np.maximum(-diff, 0.0), 1.0 / window, window)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(down == 0, 100.0, 100.0 - 100.0 / (1.0 + up / down))
+
+def _macd(close, window_slow=26, window_fast=12, window_sign=9):
+    """MACD line, signal line and histogram"""
+    macd = _ema(close, window_fast) - _ema(close, window_slow)
+    signal = _ema(macd, window_sign)
+    return macd, signal, macd - signal
+
+def _rolling_std(x, window):
+    """Population standard deviation over a trailing window"""
+    out = np.full(len(x), np.nan)
+    if len(x) >= window:
+        out[window - 1:] = sliding_window_view(x, window).std(axis=1)
+    return out
+
+def _bollinger(close, window=20, window_dev=2):
+    """Bollinger Bands as (upper, lower, middle)"""
+    mid = _sma(close, window)
+    band = window_dev * _rolling_std(close, window)
+    return mid + band, mid - band, mid
+
+@njit(cache=True, nogil=True)
+def _wilder(x, alpha, seed_n):
+    """
+    Wilder-style smoothing: seeded with the mean of the first seed_n values after
+    any leading NaNs, then y[i] = y[i-1] + alpha * (x[i] - y[i-1]). NaN before the seed.
+    """
+    n = x.shape[0]
+    out = np.full(n, np.nan)
+    start = 0
+    while start < n and np.isnan(x[start]):
+        start += 1
+    seed = start + seed_n - 1
+    if seed >= n:
+        return out
+    y = x[start:seed + 1].mean()
+    out[seed] = y
+    for i in range(seed + 1, n):
+        y = y + alpha * (x[i] - y)
+        out[i] = y
+    return out
+
+@njit(cache=True, nogil=True)
+def _true_range(high, low, close):
+    """True range; the first bar has no previous close and uses high - low"""
+    n = close.shape[0]
+    tr = np.empty(n)
+    for i in range(n):
+        tr[i] = high[i] - low[i]
+        if i > 0:
+            tr[i] = max(tr[i], abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1]))
+    return tr
+
+def _atr(high, low, close, window=14):
+    """Average True Range, zero until the first full window like the ta library"""
+    atr = _wilder(_true_range(high, low, close), 1.0 / window, window)
+    atr[np.isnan(atr)] = 0.0
+    return atr
+
+@njit(cache=True, nogil=True)
+def _directional_movement(high, low, close):
+    """
+    Per-bar inputs of the ta library's ADX: the high/low range including the
+    previous close, and the +DM/-DM moves. The first bar is NaN.
+    """
+    n = close.shape[0]
+    rng = np.full(n, np.nan)
+    pos = np.full(n, np.nan)
+    neg = np.full(n, np.nan)
+    for i in range(1, n):
+        rng[i] = max(high[i], close[i - 1]) - min(low[i], close[i - 1])
+        up = high[i] - high[i - 1]
+        down = low[i - 1] - low[i]
+        pos[i] = up if up > down and up > 0 else 0.0
+        neg[i] = down if down > up and down > 0 else 0.0
+    return rng, pos, neg
+
+@njit(cache=True, nogil=True)
+def _adx_from_smoothed(rng, pos, neg, window):
+    """ADX, +DI and -DI from Wilder-smoothed inputs, aligned the way the ta library emits them"""
+    n = rng.shape[0]
+    adx = np.zeros(n)
+    di_plus = np.zeros(n)
+    di_minus = np.zeros(n)
+    dx = np.zeros(n)
+    for i in range(window, n):
+        dip = 100 * (pos[i] / rng[i]) if rng[i] != 0 else 0.0
+        din = 100 * (neg[i] / rng[i]) if rng[i] != 0 else 0.0
+        if dip + din != 0:
+            dx[i] = 100 * abs((dip - din) / (dip + din))
+        # ta leaves the DI lines at zero on the seed bar
+        if i > window:
+            di_plus[i] = dip
+            di_minus[i] = din
+    
+    first = 2 * window - 1
+    if first < n:
+        adx[first] = dx[window:first + 1].mean()
+        for i in range(first + 1, n):
+            adx[i] = (adx[i - 1] * (window - 1) + dx[i]) / window
+    return adx, di_plus, di_minus
+
+def _adx(high, low, close, window=14):
+    """Average Directional Index with +DI/-DI, matching ta's ADXIndicator"""
+    rng, pos, neg = _directional_movement(high, low, close)
+    alpha = 1.0 / window
+    return _adx_from_smoothed(
+        _wilder(rng, alpha, window), _wilder(pos, alpha, window), _wilder(neg, alpha, window), window
+    )
+
+@njit(cache=True, nogil=True)
+def _obv(close, volume):
+    """On-Balance Volume; unchanged closes count as up days like the ta library"""
+    n = close.shape[0]
+    out = np.empty_like(volume)
+    if n == 0:
+        return out
+    out[0] = volume[0]
+    for i in range(1, n):
+        if close[i] < close[i - 1]:
+            out[i] = out[i - 1] - volume[i]
+        else:
+            out[i] = out[i - 1] + volume[i]
+    return out
+
+@njit(cache=True, nogil=True, error_model='numpy')
+def _cmf(high, low, close, volume, window=20):
+    """Chaikin Money Flow over a trailing window, with zero money flow on flat bars"""
+    n = close.shape[0]
+    out = np.full(n, np.nan)
+    mfv = np.empty(n)
+    mfv_sum = 0.0
+    volume_sum = 0.0
+    for i in range(n):
+        multiplier = ((close[i] - low[i]) - (high[i] - close[i])) / (high[i] - low[i])
+        if np.isnan(multiplier):
+            multiplier = 0.0
+        mfv[i] = multiplier * volume[i]
+        mfv_sum += mfv[i]
+        volume_sum += volume[i]
+        if i >= window:
+            mfv_sum -= mfv[i - window]
+            volume_sum -= volume[i - window]
+        if i >= window - 1:
+            out[i] = mfv_sum / volume_sum
+    return out
+
+def _compute_indicators_np(close, high, low, volume):
+    """
+    Calculate the array-based indicators from raw OHLCV columns
+    :return: Dictionary of indicator arrays keyed by column name
+    """
+    indicators = {}
+    
+    # Price-based indicators
+    indicators['SMA_20'] = _sma(close, 20)
+    indicators['SMA_50'] = _sma(close, 50)
+    indicators['EMA_20'] = _ema(close, 20)
+    indicators['EMA_50'] = _ema(close, 50)
+    
+    # Momentum indicators
+    indicators['RSI'] = _rsi(close)
+    
+    # Trend indicators
+    indicators['MACD'], indicators['MACD_Signal'], indicators['MACD_Hist'] = _macd(close)
+    
+    # Volatility indicators
+    bb_upper, bb_lower, bb_mid = _bollinger(close)
+    indicators['BB_Upper'] = bb_upper
+    indicators['BB_Lower'] = bb_lower
+    indicators['BB_Mid'] = bb_mid
+    bb_width = np.subtract(bb_upper, bb_lower)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        np.divide(bb_width, bb_mid, out=bb_width)
+    indicators['BB_Width'] = bb_width
+    
+    # ADX for trend strength
+    indicators['ADX'], indicators['DI_plus'], indicators['DI_minus'] = _adx(high, low, close)
+    
+    # ATR for volatility
+    indicators['ATR'] = _atr(high, low, close)
+    
+    # Volume indicators
+    indicators['OBV'] = _obv(close, volume)
+    indicators['CMF'] = _cmf(high, low, close, volume.astype(np.float64))
+    volume_ma = _sma(volume.astype(np.float64), 20)
+    indicators['Volume_MA'] = volume_ma
+    with np.errstate(divide='ignore', invalid='ignore'):
+        indicators['Volume_Ratio'] = volume / volume_ma
+    
+    # Support and Resistance levels
+    pivot = np.add(high, low)
+    pivot += close
+    pivot /= 3
+    r1 = np.multiply(pivot, 2)
+    r1 -= low
+    s1 = np.multiply(pivot, 2)
+    s1 -= high
+    indicators['Pivot'] = pivot
+    indicators['R1'] = r1
+    indicators['S1'] = s1
+    
+    # Fibonacci Retracement levels
+    highest = np.nanmax(high)
+    indicators.update(zip(_FIB_COLUMNS, highest - _FIB * (highest - np.nanmin(low))))
+    
+    # VWAP calculation
+    vwap = np.multiply(close, volume, dtype=np.float64)
+    np.cumsum(vwap, out=vwap)
+    volume_cum = np.cumsum(volume, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        np.divide(vwap, volume_cum, out=vwap)
+    indicators['VWAP'] = vwap
+    
+    return indicators
+
+def _compute_indicators_ta(df):
+    """
+    Calculate the indicators still taken from the ta library
+    :return: Dictionary of indicator Series keyed by column name
+    """
+    high, low, close, volume = df['High'], df['Low'], df['Close'], df['Volume']
+    indicators = {}
+    
+    # Momentum indicators
+    stoch = StochasticOscillator(high=high, low=low, close=close)
+    indicators['Stoch_K'] = stoch.stoch()
+    indicators['Stoch_D'] = stoch.stoch_signal()
+    indicators['TSI'] = TSIIndicator(close=close).tsi()
+    
+    # Vortex Indicator
+    vortex = VortexIndicator(high=high, low=low, close=close)
+    indicators['VI_plus'] = vortex.vortex_indicator_pos()
+    indicators['VI_minus'] = vortex.vortex_indicator_neg()
+    
+    # Volume indicators
+    indicators['EOM'] = EaseOfMovementIndicator(high=high, low=low, volume=volume).ease_of_movement()
+    
+    return indicators
+
 def calculate_custom_indicators(df):
     """Calculate custom technical indicators"""
     try:
-        # Price-based indicators
-        df['SMA_20'] = SMAIndicator(close=df['Close'], window=20).sma_indicator()
-        df['SMA_50'] = SMAIndicator(close=df['Close'], window=50).sma_indicator()
-        df['EMA_20'] = EMAIndicator(close=df['Close'], window=20).ema_indicator()
-        df['EMA_50'] = EMAIndicator(close=df['Close'], window=50).ema_indicator()
-        
-        # Momentum indicators
-        df['RSI'] = RSIIndicator(close=df['Close']).rsi()
-        stoch = StochasticOscillator(high=df['High'], low=df['Low'], close=df['Close'])
-        df['Stoch_K'] = stoch.stoch()
-        df['Stoch_D'] = stoch.stoch_signal()
-        df['TSI'] = TSIIndicator(close=df['Close']).tsi()
-        
-        # Trend indicators
-        macd = MACD(close=df['Close'])
-        df['MACD'] = macd.macd()
-        df['MACD_Signal'] = macd.macd_signal()
-        df['MACD_Hist'] = macd.macd_diff()
-        
-        # ADX for trend strength
-        adx = ADXIndicator(high=df['High'], low=df['Low'], close=df['Close'])
-        df['ADX'] = adx.adx()
-        df['DI_plus'] = adx.adx_pos()
-        df['DI_minus'] = adx.adx_neg()
+        indicators = _compute_indicators_np(
+            df['Close'].to_numpy(dtype=np.float64),
+            df['High'].to_numpy(dtype=np.float64),
+            df['Low'].to_numpy(dtype=np.float64),
+            df['Volume'].to_numpy(),
+        )
+        indicators.update(_compute_indicators_ta(df))
         
-        # Vortex Indicator
-        vortex = VortexIndicator(high=df['High'], low=df['Low'], close=df['Close'])
-        df['VI_plus'] = vortex.vortex_indicator_pos()
-        df['VI_minus'] = vortex.vortex_indicator_neg()
-        
-        # Volatility indicators
-        bb = BollingerBands(close=df['Close'])
-        df['BB_Upper'] = bb.bollinger_hband()
-        df['BB_Lower'] = bb.bollinger_lband()
-        df['BB_Mid'] = bb.bollinger_mavg()
-        df['BB_Width'] = (df['BB_Upper'] - df['BB_Lower']) / df['BB_Mid']
-        
-        # ATR for volatility
-        atr = AverageTrueRange(high=df['High'], low=df['Low'], close=df['Close'])
-        df['ATR'] = atr.average_true_range()
-        
-        # Volume indicators
-        df['OBV'] = OnBalanceVolumeIndicator(close=df['Close'], volume=df['Volume']).on_balance_volume()
-        df['CMF'] = ChaikinMoneyFlowIndicator(high=df['High'], low=df['Low'], close=df['Close'], volume=df['Volume']).chaikin_money_flow()
-        df['EOM'] = EaseOfMovementIndicator(high=df['High'], low=df['Low'], volume=df['Volume']).ease_of_movement()
-        df['Volume_MA'] = df['Volume'].rolling(window=20).mean()
-        df['Volume_Ratio'] = df['Volume'] / df['Volume_MA']
-        
-        # Support and Resistance levels
-        df['Pivot'] = (df['High'] + df['Low'] + df['Close']) / 3
-        df['R1'] = 2 * df['Pivot'] - df['Low']
-        df['S1'] = 2 * df['Pivot'] - df['High']
-        
-        # Fibonacci Retracement levels
-        high = df['High'].max()
-        low = df['Low'].min()
-        diff = high - low
-        df['Fib_38.2'] = high - (0.382 * diff)
-        df['Fib_50.0'] = high - (0.500 * diff)
-        df['Fib_61.8'] = high - (0.618 * diff)
-        
-        # VWAP calculation
-        df['VWAP'] = (df['Close'] * df['Volume']).cumsum() / df['Volume'].cumsum()
-        
-        return df
+        # Add every column in one step instead of one block insert per indicator
+        return df.assign(**indicators)
     except Exception as e:
         logger.error(f"Error calculating custom indicators: {e}")
         return df
@@ -134,70 +379,199 @@ def get_signal_strength(row):
         
     return strength
 
+@njit(cache=True, nogil=True)
+def _signal_strength_kernel(close, sma20, sma50, adx, di_p, di_m, rsi, macd, macd_sig,
+                            vi_p, vi_m, vol_ratio, cmf, s1, r1, atr):
+    """Array version of get_signal_strength, evaluated for every row in one pass"""
+    n = close.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    for i in range(n):
+        strength = 0.0
+        c = close[i]
+        
+        # Trend strength
+        if c > sma20[i] and sma20[i] > sma50[i]:
+            strength += 1.5
+        elif c < sma20[i] and sma20[i] < sma50[i]:
+            strength -= 1.5
+        
+        # ADX trend strength
+        if adx[i] > 25:
+            if di_p[i] > di_m[i]:
+                strength += 1
+            else:
+                strength -= 1
+        
+        # RSI signals
+        if rsi[i] < 30:
+            strength += 1
+        elif rsi[i] > 70:
+            strength -= 1
+        
+        # MACD signals
+        if macd[i] > macd_sig[i]:
+            strength += 1
+        else:
+            strength -= 1
+        
+        # Vortex Indicator
+        if vi_p[i] > vi_m[i]:
+            strength += 0.5
+        else:
+            strength -= 0.5
+        
+        # Volume and Money Flow
+        if vol_ratio[i] > 1.5 and cmf[i] > 0:
+            strength = strength * 1.2 if strength > 0 else strength * 0.8
+        
+        # Support/Resistance confirmation
+        if c < s1[i]:
+            strength += 0.5
+        elif c > r1[i]:
+            strength -= 0.5
+        
+        # ATR volatility adjustment
+        if atr[i] / c > 0.02:
+            strength = strength * 0.8
+        
+        out[i] = strength
+    return out
+
+def _signal_strength_vectorized(close, sma20, sma50, adx, di_p, di_m, rsi, macd, macd_sig,
+                                vi_p, vi_m, vol_ratio, cmf, s1, r1, atr):
+    """NumPy mask version of get_signal_strength, used when numba is unavailable"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Trend strength
+        up = (close > sma20) & (sma20 > sma50)
+        down = (close < sma20) & (sma20 < sma50)
+        strength = 1.5 * up - 1.5 * down
+        
+        # ADX trend strength
+        trending = adx > 25
+        di_up = di_p > di_m
+        strength += 1.0 * (trending & di_up) - 1.0 * (trending & ~di_up)
+        
+        # RSI signals
+        oversold = rsi < 30
+        strength += 1.0 * oversold - 1.0 * (~oversold & (rsi > 70))
+        
+        # MACD signals
+        strength += np.where(macd > macd_sig, 1.0, -1.0)
+        
+        # Vortex Indicator
+        strength += np.where(vi_p > vi_m, 0.5, -0.5)
+        
+        # Volume and Money Flow
+        boost = (vol_ratio > 1.5) & (cmf > 0)
+        strength *= np.where(boost, np.where(strength > 0, 1.2, 0.8), 1.0)
+        
+        # Support/Resistance confirmation
+        support = close < s1
+        strength += 0.5 * support - 0.5 * (~support & (close > r1))
+        
+        # ATR volatility adjustment
+        strength *= np.where(atr / close > 0.02, 0.8, 1.0)
+    return strength
+
+_signal_strength = _signal_strength_kernel if NUMBA_AVAILABLE else _signal_strength_vectorized
+
+def _column(df, name):
+    return df[name].to_numpy(dtype=np.float64)
+
+def _map_symbols(func, data):
+    """
+    Apply func(symbol, df) to every symbol on a thread pool
+    :param func: Callable returning a DataFrame, or None to drop the symbol
+    :param data: Dictionary of DataFrames keyed by symbol
+    :return: Dictionary of results in the original symbol order
+    """
+    if not data:
+        return {}
+    
+    symbols = list(data)
+    max_workers = min(len(symbols), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(lambda symbol: func(symbol, data[symbol]), symbols)
+        return {symbol: df for symbol, df in zip(symbols, results) if df is not None}
+
+def _indicators_for_symbol(symbol, df, cache):
+    """Calculate indicators for one symbol, returning None if it has to be skipped"""
+    try:
+        if len(df) < 50:  # Need at least 50 data points for reliable indicators
+            logger.warning(f"Insufficient data points for {symbol}. Skipping...")
+            return None
+        
+        # Reuse last run's indicators if the price history has not changed
+        cached = cache.load(symbol, df)
+        if cached is not None:
+            logger.debug("Loaded cached indicators for %s", symbol)
+            return cached
+        
+        # Calculate custom indicators
+        result = calculate_custom_indicators(df)
+        if result is not df:  # df itself is returned when the calculation failed
+            cache.save(symbol, df, result)
+        logger.debug("Successfully calculated indicators for %s", symbol)
+        return result
+        
+    except Exception as e:
+        logger.error(f"Error calculating indicators for {symbol}: {e}")
+        return None
+
 def calculate_technical_indicators(data):
     """
     Calculate technical indicators for the given stock data
     :param data: Dictionary of processed DataFrames with stock data
     :return: Dictionary of DataFrames with added technical indicators
     """
-    analyzed_data = {}
-    for symbol, df in data.items():
-        try:
-            if len(df) < 50:  # Need at least 50 data points for reliable indicators
-                logger.warning(f"Insufficient data points for {symbol}. Skipping...")
-                continue
-            
-            # Calculate custom indicators
-            df = calculate_custom_indicators(df)
-            
-            # Add to analyzed data if successful
-            analyzed_data[symbol] = df
-            logger.info(f"Successfully calculated indicators for {symbol}")
-            
-        except Exception as e:
-            logger.error(f"Error calculating indicators for {symbol}: {e}")
-            continue
-
+    start = time.perf_counter()
+    cache = IndicatorCache(INDICATOR_VERSION)
+    analyzed_data = _map_symbols(lambda symbol, df: _indicators_for_symbol(symbol, df, cache), data)
+    cache.evict()
+    logger.info("Computed indicators for %d/%d symbols in %.2fs",
+                len(analyzed_data), len(data), time.perf_counter() - start)
     return analyzed_data
 
+def _signals_for_symbol(symbol, df):
+    """Generate signals for one symbol, returning None on failure"""
+    try:
+        # Calculate signal strength
+        df['Signal_Strength'] = _signal_strength(
+            _column(df, 'Close'), _column(df, 'SMA_20'), _column(df, 'SMA_50'),
+            _column(df, 'ADX'), _column(df, 'DI_plus'), _column(df, 'DI_minus'),
+            _column(df, 'RSI'), _column(df, 'MACD'), _column(df, 'MACD_Signal'),
+            _column(df, 'VI_plus'), _column(df, 'VI_minus'),
+            _column(df, 'Volume_Ratio'), _column(df, 'CMF'),
+            _column(df, 'S1'), _column(df, 'R1'), _column(df, 'ATR'),
+        )
+        
+        # Generate signals based on strength; anything between -1 and 1 is a Hold
+        strength = df['Signal_Strength'].to_numpy()
+        df['Signal'] = np.select(
+            [strength > 2.5, strength > 1, strength < -2.5, strength < -1],
+            ['Strong Buy', 'Buy', 'Strong Sell', 'Sell'],
+            default='Hold'
+        )
+        
+        # Add key indicator values for reference
+        rounded = df[['RSI', 'MACD', 'BB_Width']].round({'RSI': 2, 'MACD': 3, 'BB_Width': 3})
+        df[['Signal_RSI', 'Signal_MACD', 'Signal_BB_Width']] = rounded.to_numpy()
+        
+        logger.debug("Generated signals for %s", symbol)
+        return df
+        
+    except Exception as e:
+        logger.error(f"Error generating signals for {symbol}: {e}")
+        return None
+
 def generate_signals(data):
     """
     Generate buy/sell signals based on technical indicators
     :param data: Dictionary of DataFrames with technical indicators
     :return: Dictionary of DataFrames with buy/sell signals
     """
-    signals = {}
-    for symbol, df in data.items():
-        try:
-            # Calculate signal strength
-            df['Signal_Strength'] = df.apply(get_signal_strength, axis=1)
-            
-            # Generate signals based on strength
-            conditions = {
-                'Strong Buy': df['Signal_Strength'] > 2.5,
-                'Buy': (df['Signal_Strength'] > 1) & (df['Signal_Strength'] <= 2.5),
-                'Hold': (df['Signal_Strength'] >= -1) & (df['Signal_Strength'] <= 1),
-                'Sell': (df['Signal_Strength'] < -1) & (df['Signal_Strength'] >= -2.5),
-                'Strong Sell': df['Signal_Strength'] < -2.5
-            }
-            
-            # Initialize signal column with 'Hold'
-            df['Signal'] = 'Hold'
-            
-            # Apply conditions
-            for signal, condition in conditions.items():
-                df.loc[condition, 'Signal'] = signal
-            
-            # Add key indicator values for reference
-            df['Signal_RSI'] = df['RSI'].round(2)
-            df['Signal_MACD'] = df['MACD'].round(3)
-            df['Signal_BB_Width'] = df['BB_Width'].round(3)
-            
-            signals[symbol] = df
-            logger.info(f"Generated signals for {symbol}")
-            
-        except Exception as e:
-            logger.error(f"Error generating signals for {symbol}: {e}")
-            continue
-
-    return signals
\ No newline at end of file
+    start = time.perf_counter()
+    signals = _map_symbols(_signals_for_symbol, data)
+    logger.info("Generated signals for %d/%d symbols in %.2fs",
+                len(signals), len(data), time.perf_counter() - start)
+    return signals
@@ -18,39 +18,48 @@ def format_price(price):
 
 def print_stock_analysis(symbol, df, signal):
     """Print detailed analysis for a stock"""
-    current_price = df['Close'].iloc[-1]
-    prev_close = df['Close'].iloc[-2]
+    close = df['Close'].to_numpy()
+    current_price = close[-1]
+    prev_close = close[-2]
     price_change = ((current_price - prev_close) / prev_close) * 100
     
     # Format indicators
-    rsi = df['RSI'].iloc[-1]
-    macd = df['MACD'].iloc[-1]
-    signal_strength = df['Signal_Strength'].iloc[-1]
+    rsi = df['RSI'].iat[-1]
+    macd = df['MACD'].iat[-1]
+    signal_strength = df['Signal_Strength'].iat[-1]
     
     # Volume analysis
-    vol_ratio = df['Volume_Ratio'].iloc[-1]
+    vol_ratio = df['Volume_Ratio'].iat[-1]
     vol_trend = "High" if vol_ratio > 1.5 else "Low" if vol_ratio < 0.5 else "Normal"
     
     # Price vs Moving Averages
-    sma_20 = df['SMA_20'].iloc[-1]
-    sma_50 = df['SMA_50'].iloc[-1]
+    sma_20 = df['SMA_20'].iat[-1]
+    sma_50 = df['SMA_50'].iat[-1]
     
-    # Format output
-    logger.info(f"\n{'='*50}")
-    logger.info(f"Stock Analysis: {symbol}")
-    logger.info(f"{'='*50}")
-    logger.info(f"Signal: {signal}")
-    logger.info(f"Current Price: {format_price(current_price)} ({price_change:+.2f}%)")
-    logger.info(f"\nKey Indicators:")
-    logger.info(f"RSI: {rsi:.2f}")
-    logger.info(f"MACD: {macd:.3f}")
-    logger.info(f"Signal Strength: {signal_strength:.2f}")
-    logger.info(f"\nMoving Averages:")
-    logger.info(f"SMA20: {format_price(sma_20)}")
-    logger.info(f"SMA50: {format_price(sma_50)}")
-    logger.info(f"\nVolume Analysis:")
-    logger.info(f"Volume Trend: {vol_trend} (Ratio: {vol_ratio:.2f})")
-    logger.info(f"{'='*50}\n")
+    # Format output as a single record so concurrent output cannot interleave with it
+    lines = [
+        "",
+        "=" * 50,
+        f"Stock Analysis: {symbol}",
+        "=" * 50,
+        f"Signal: {signal}",
+        f"Current Price: {format_price(current_price)} ({price_change:+.2f}%)",
+        "",
+        "Key Indicators:",
+        f"RSI: {rsi:.2f}",
+        f"MACD: {macd:.3f}",
+        f"Signal Strength: {signal_strength:.2f}",
+        "",
+        "Moving Averages:",
+        f"SMA20: {format_price(sma_20)}",
+        f"SMA50: {format_price(sma_50)}",
+        "",
+        "Volume Analysis:",
+        f"Volume Trend: {vol_trend} (Ratio: {vol_ratio:.2f})",
+        "=" * 50,
+        "",
+    ]
+    logger.info("\n".join(lines))
 
 def run_cli():
     parser = argparse.ArgumentParser(description="SmartScan - NSE Market Scanner")
@@ -119,8 +128,8 @@ def run_cli():
     
     for symbol, df in signals.items():
         if df is not None and not df.empty:
-            signal = df['Signal'].iloc[-1]
-            strength = abs(df['Signal_Strength'].iloc[-1])
+            signal = df['Signal'].iat[-1]
+            strength = abs(df['Signal_Strength'].iat[-1])
             
             if signal != 'Hold' and strength >= args.min_strength:
                 signal_groups[signal].append((symbol, df))
@@ -1,11 +1,115 @@
 import sqlite3
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 import logging
 import os
+import time
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+OHLCV_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+# Prices are stored as integer paise: 0.01 INR resolution, and int32-sized up to about 21M INR
+PRICE_SCALE = 100
+
+def _to_ticks(prices):
+    """Convert a price Series in rupees to a list of integer paise"""
+    return np.rint(prices.to_numpy(dtype=np.float64) * PRICE_SCALE).astype(np.int64).tolist()
+
+def as_stored(data):
+    """
+    Return an OHLCV frame exactly as it reads back from the database: rows with
+    missing values dropped, day-resolution dates and prices rounded to paise
+    """
+    data = data.dropna(subset=OHLCV_COLUMNS)
+    columns = {
+        column: np.rint(data[column].to_numpy(dtype=np.float64) * PRICE_SCALE) / PRICE_SCALE
+        for column in ['Open', 'High', 'Low', 'Close']
+    }
+    columns['Volume'] = data['Volume'].to_numpy().astype(np.int64)
+    return pd.DataFrame(columns, index=pd.DatetimeIndex(data.index.strftime('%Y-%m-%d'), name='date'))
+
+def _query_rows(cursor, symbol, start_date, end_date):
+    """
+    Run the range query for a symbol on an open cursor.
+    Returns a tuple (dates, open, high, low, close, volume) of an immutable index
+    and read-only arrays, or None if no rows are stored.
+    """
+    query = '''
+        SELECT date, open, high, low, close, volume
+        FROM stock_data
+        WHERE symbol = ? AND date BETWEEN ? AND ?
+        ORDER BY date
+    '''
+    
+    rows = cursor.execute(
+        query,
+        (symbol, start_date.isoformat(), end_date.isoformat())
+    ).fetchall()
+    
+    if not rows:
+        return None
+    
+    # Transpose the rows once and build one contiguous array per column,
+    # converting prices back from paise to rupees
+    dates, opens, highs, lows, closes, volumes = zip(*rows)
+    columns = tuple(
+        np.array(prices, dtype=np.float64) / PRICE_SCALE
+        for prices in (opens, highs, lows, closes)
+    ) + (np.array(volumes, dtype=np.int64),)
+    for array in columns:
+        array.flags.writeable = False
+    return (pd.DatetimeIndex(dates, name='date'),) + columns
+
+def _query_freshness(cursor, symbol):
+    """Check on an open cursor whether the stored data for a symbol is recent enough"""
+    # Get the latest data date and last update timestamp
+    query = '''
+        SELECT MAX(date), MAX(last_updated)
+        FROM stock_data
+        WHERE symbol = ?
+    '''
+    
+    cursor.execute(query, (symbol,))
+    latest_date, last_updated = cursor.fetchone()
+    
+    if latest_date is None or last_updated is None:
+        return False
+    
+    # Convert to IST (UTC+5:30)
+    ist_now = datetime.now() + timedelta(hours=5, minutes=30)
+    last_updated = datetime.strptime(last_updated, '%Y-%m-%d %H:%M:%S.%f')
+    latest_date = datetime.strptime(latest_date, '%Y-%m-%d').date()
+    
+    # If it's before 5:30 PM IST, we can use yesterday's data
+    cutoff_time = ist_now.replace(hour=17, minute=30, second=0, microsecond=0)
+    if ist_now < cutoff_time:
+        latest_required_date = (ist_now - timedelta(days=2)).date()
+    else:
+        latest_required_date = (ist_now - timedelta(days=1)).date()
+    
+    return latest_date >= latest_required_date
+
+@lru_cache(maxsize=256)
+def _read_symbol(db_path, symbol, start_date, end_date, minute_bucket):
+    """
+    Freshness check and range query for a symbol on one connection, memoized
+    per minute bucket. Returns (rows, is_fresh); rows is None if nothing is stored.
+    """
+    with sqlite3.connect(db_path) as conn:
+        cursor = conn.cursor()
+        return _query_rows(cursor, symbol, start_date, end_date), _query_freshness(cursor, symbol)
+
+def _minute_bucket():
+    # Bucket by minute so a cached answer is reused for at most 60 seconds
+    return int(time.time() // 60)
+
+def _rows_to_frame(rows):
+    dates, *columns = rows
+    return pd.DataFrame(dict(zip(OHLCV_COLUMNS, columns)), index=dates)
+
 class DatabaseManager:
     def __init__(self):
         # Get the absolute path to the project root
@@ -25,20 +129,36 @@ class DatabaseManager:
             with sqlite3.connect(self.db_path) as conn:
                 cursor = conn.cursor()
                 
-                # Create stock data table
+                # WAL lets readers proceed while a save is in progress
+                cursor.execute("PRAGMA journal_mode=WAL")
+                
+                # Tables written by older versions either have no primary key (DataFrame.to_sql),
+                # which the upsert in save_multiple_stock_data relies on, or store prices as REAL
+                # instead of paise; they only hold cached downloads, so drop them and start over
+                columns = cursor.execute("PRAGMA table_info(stock_data)").fetchall()
+                column_types = {column[1].lower(): column[2].upper() for column in columns}
+                if columns and (not any(column[5] for column in columns)
+                                or column_types.get('close') != 'INTEGER'):
+                    logger.warning("Recreating stock_data table from an older schema")
+                    cursor.execute("DROP TABLE stock_data")
+                
+                # Create stock data table; prices are stored as integer paise
                 cursor.execute('''
                     CREATE TABLE IF NOT EXISTS stock_data (
                         symbol TEXT,
                         date DATE,
-                        open REAL,
-                        high REAL,
-                        low REAL,
-                        close REAL,
+                        open INTEGER,
+                        high INTEGER,
+                        low INTEGER,
+                        close INTEGER,
                         volume INTEGER,
                         last_updated TIMESTAMP,
                         PRIMARY KEY (symbol, date)
                     )
                 ''')
+                cursor.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_symbol_date ON stock_data(symbol, date)"
+                )
                 
                 conn.commit()
                 logger.info("Database initialized successfully")
@@ -46,89 +166,99 @@ class DatabaseManager:
             logger.error(f"Error initializing database: {str(e)}")
             raise
 
+    def fetch_if_fresh(self, symbol: str, start_date: datetime, end_date: datetime):
+        """
+        Check freshness and retrieve stock data in a single connection
+        Returns (DataFrame or None, is_fresh); the DataFrame is None if data is stale or missing
+        """
+        try:
+            rows, is_fresh = _read_symbol(
+                self.db_path, symbol, start_date.date(), end_date.date(), _minute_bucket()
+            )
+            if rows is None or not is_fresh:
+                return None, is_fresh
+            return _rows_to_frame(rows), is_fresh
+                
+        except Exception as e:
+            logger.error(f"Error retrieving data for {symbol}: {str(e)}")
+            return None, False
+
     def get_stock_data(self, symbol: str, start_date: datetime, end_date: datetime) -> pd.DataFrame:
         """
         Retrieve stock data from the database
         Returns None if data is not found or is outdated
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                query = '''
-                    SELECT date, open, high, low, close, volume
-                    FROM stock_data
-                    WHERE symbol = ? AND date BETWEEN ? AND ?
-                    ORDER BY date
-                '''
-                
-                df = pd.read_sql_query(
-                    query, 
-                    conn,
-                    params=(symbol, start_date.date(), end_date.date()),
-                    parse_dates=['date']
-                )
-                
-                if len(df) > 0:
-                    df.set_index('date', inplace=True)
-                    return df
+            rows, _ = _read_symbol(
+                self.db_path, symbol, start_date.date(), end_date.date(), _minute_bucket()
+            )
+            if rows is None:
                 return None
+            
+            return _rows_to_frame(rows)
                 
         except Exception as e:
             logger.error(f"Error retrieving data for {symbol}: {str(e)}")
             return None
 
+    @staticmethod
+    def _prepare_rows(symbol: str, data: pd.DataFrame, last_updated: str) -> list:
+        """
+        Flatten a symbol's OHLCV frame into stock_data row tuples. Prices are
+        rounded to the nearest paisa (0.01 INR) and stored as integer ticks.
+        Rows with missing values are skipped.
+        """
+        data = data.dropna(subset=OHLCV_COLUMNS)
+        n = len(data)
+        return list(zip(
+            [symbol] * n,
+            data.index.strftime('%Y-%m-%d'),
+            *(_to_ticks(data[column]) for column in ['Open', 'High', 'Low', 'Close']),
+            data['Volume'].astype('int64').tolist(),
+            [last_updated] * n,
+        ))
+
     def save_stock_data(self, symbol: str, data: pd.DataFrame):
         """Save stock data to the database"""
+        if data is None or data.empty:
+            logger.warning(f"No data to save for {symbol}")
+            return
+        self.save_multiple_stock_data({symbol: data})
+
+    def save_multiple_stock_data(self, data: dict):
+        """Save stock data for several symbols in a single transaction"""
         try:
-            if data is None or data.empty:
-                logger.warning(f"No data to save for {symbol}")
+            last_updated = datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')
+            rows = []
+            for symbol, df in data.items():
+                if df is not None and not df.empty:
+                    rows.extend(self._prepare_rows(symbol, df, last_updated))
+            if not rows:
+                logger.warning("No data to save")
                 return
 
             with sqlite3.connect(self.db_path) as conn:
-                # Prepare data for insertion
-                df_to_save = data.reset_index()
-                df_to_save['symbol'] = symbol
-                df_to_save['last_updated'] = datetime.now()
+                conn.execute("PRAGMA synchronous=NORMAL")
                 
-                # Insert data
-                df_to_save.to_sql('stock_data', conn, if_exists='replace', index=False)
-                logger.info(f"Successfully saved data for {symbol}")
+                # Upsert on the (symbol, date) primary key, leaving other symbols untouched
+                conn.executemany(
+                    "INSERT OR REPLACE INTO stock_data VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+                logger.info(f"Successfully saved {len(rows)} rows for {len(data)} symbols")
+            
+            # Saved rows change both the stored ranges and their freshness
+            _read_symbol.cache_clear()
                 
         except Exception as e:
-            logger.error(f"Error saving data for {symbol}: {str(e)}")
+            logger.error(f"Error saving stock data: {str(e)}")
             raise
 
     def is_data_fresh(self, symbol: str, lookback_days: int = 1) -> bool:
         """Check if we have fresh data for the symbol"""
         try:
             with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                # Get the latest data date and last update timestamp
-                query = '''
-                    SELECT MAX(date), MAX(last_updated)
-                    FROM stock_data
-                    WHERE symbol = ?
-                '''
-                
-                cursor.execute(query, (symbol,))
-                latest_date, last_updated = cursor.fetchone()
-                
-                if latest_date is None or last_updated is None:
-                    return False
-                
-                # Convert to IST (UTC+5:30)
-                ist_now = datetime.now() + timedelta(hours=5, minutes=30)
-                last_updated = datetime.strptime(last_updated, '%Y-%m-%d %H:%M:%S.%f')
-                latest_date = datetime.strptime(latest_date, '%Y-%m-%d').date()
-                
-                # If it's before 5:30 PM IST, we can use yesterday's data
-                cutoff_time = ist_now.replace(hour=17, minute=30, second=0, microsecond=0)
-                if ist_now < cutoff_time:
-                    latest_required_date = (ist_now - timedelta(days=2)).date()
-                else:
-                    latest_required_date = (ist_now - timedelta(days=1)).date()
-                
-                return latest_date >= latest_required_date
+                return _query_freshness(conn.cursor(), symbol)
                 
         except Exception as e:
             logger.error(f"Error checking data freshness for {symbol}: {str(e)}")
@@ -1,6 +1,7 @@
 import yfinance as yf
 import pandas as pd
 import os
+import time
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -38,10 +39,27 @@ def get_nifty50_symbols():
         logger.error(f"Error reading CSV file: {e}")
         return []
 
-def fetch_stock_data(ticker, symbol, default_period="3mo"):
+def _fetch_history(symbol, period):
+    """
+    Fetch price history for a symbol
+    :return: Tuple of (DataFrame, symbol_known)
+    """
+    ticker = yf.Ticker(symbol)
+    stock_data = ticker.history(period=period)
+    if not stock_data.empty:
+        return stock_data, True
+    
+    # An empty response is either transient or an unknown symbol; only the former is worth retrying
+    try:
+        metadata = ticker.get_history_metadata()
+        symbol_known = bool(metadata) and 'instrumentType' in metadata
+    except Exception:
+        symbol_known = True
+    return stock_data, symbol_known
+
+def fetch_stock_data(symbol, default_period="3mo"):
     """
     Attempt to fetch stock data with different time periods
-    :param ticker: yfinance Ticker object
     :param symbol: Stock symbol
     :param default_period: Default time period to try first
     :return: Tuple of (DataFrame, period_used)
@@ -51,9 +69,9 @@ def fetch_stock_data(ticker, symbol, default_period="3mo"):
     
     for period in periods:
         try:
-            stock_data = ticker.history(period=period)
+            stock_data, symbol_known = _fetch_history(symbol, period)
             if not stock_data.empty:
-                logger.info(f"Successfully fetched {symbol} data using period: {period}")
+                logger.debug("Successfully fetched %s data using period: %s", symbol, period)
                 # If using a longer period, trim to match default_period
                 if period != default_period:
                     end_date = pd.Timestamp.now()
@@ -67,6 +85,10 @@ def fetch_stock_data(ticker, symbol, default_period="3mo"):
                     stock_data = stock_data.loc[start_date:end_date]
                 
                 return stock_data, period
+            
+            if not symbol_known:
+                logger.warning(f"Unknown symbol {symbol}, skipping remaining periods")
+                break
         except Exception as e:
             logger.warning(f"Failed to fetch {symbol} with period {period}: {e}")
     
@@ -84,12 +106,12 @@ def fetch_nifty50_data(period="3mo"):
         logger.error("No symbols found. Please check the CSV file.")
         return {}
 
+    start = time.perf_counter()
     data = {}
     for symbol in nifty50_symbols:
         try:
             # Try NSE/BSE symbol first
-            stock = yf.Ticker(symbol)
-            stock_data, used_period = fetch_stock_data(stock, symbol, period)
+            stock_data, used_period = fetch_stock_data(symbol, period)
             
             if stock_data.empty:
                 logger.warning(f"No data available for {symbol}")
@@ -97,34 +119,33 @@ def fetch_nifty50_data(period="3mo"):
                 if '.NS' in symbol:
                     # Try BSE symbol
                     bse_symbol = symbol.replace('.NS', '.BO')
-                    stock = yf.Ticker(bse_symbol)
-                    stock_data, used_period = fetch_stock_data(stock, bse_symbol, period)
+                    stock_data, used_period = fetch_stock_data(bse_symbol, period)
                     if not stock_data.empty:
                         symbol = bse_symbol
                 elif '.BO' in symbol:
                     # Try NSE symbol
                     nse_symbol = symbol.replace('.BO', '.NS')
-                    stock = yf.Ticker(nse_symbol)
-                    stock_data, used_period = fetch_stock_data(stock, nse_symbol, period)
+                    stock_data, used_period = fetch_stock_data(nse_symbol, period)
                     if not stock_data.empty:
                         symbol = nse_symbol
                 
                 # If still no data, try base symbol
                 if stock_data.empty:
                     base_symbol = symbol.replace('.NS', '').replace('.BO', '')
-                    stock = yf.Ticker(base_symbol)
-                    stock_data, used_period = fetch_stock_data(stock, base_symbol, period)
+                    stock_data, used_period = fetch_stock_data(base_symbol, period)
                     if not stock_data.empty:
                         symbol = base_symbol
             
             if not stock_data.empty:
                 data[symbol] = stock_data
-                logger.info(f"Fetched data for {symbol}")
+                logger.debug("Fetched data for %s", symbol)
             else:
                 logger.error(f"No data available for {symbol} (all formats and periods tried)")
         except Exception as e:
             logger.error(f"Error fetching data for {symbol}: {e}")
 
+    logger.info("Fetched data for %d/%d symbols in %.2fs",
+                len(data), len(nifty50_symbols), time.perf_counter() - start)
     return data
 
 if __name__ == "__main__":
@@ -2,7 +2,7 @@ import yfinance as yf
 import pandas as pd
 from datetime import datetime, timedelta
 import logging
-from .db_manager import DatabaseManager
+from .db_manager import DatabaseManager, as_stored
 
 logger = logging.getLogger(__name__)
 
@@ -10,6 +10,18 @@ class StockDataCollector:
     def __init__(self):
         self.db = DatabaseManager()
 
+    @staticmethod
+    def _date_range(period: str):
+        """Translate a yfinance period into the (start, end) range stored in the database"""
+        end_date = datetime.now()
+        if period == "3mo":
+            start_date = end_date - timedelta(days=90)
+        elif period == "1y":
+            start_date = end_date - timedelta(days=365)
+        else:
+            start_date = end_date - timedelta(days=90)  # default to 3mo
+        return start_date, end_date
+
     def get_stock_data(self, symbol: str, period: str = "3mo") -> pd.DataFrame:
         """
         Get stock data for a given symbol. First tries to get from local database,
@@ -19,48 +31,86 @@ class StockDataCollector:
         :param period: Time period for data (e.g., '3mo', '1y')
         :return: DataFrame with stock data
         """
+        return self.get_multiple_stock_data([symbol], period).get(symbol, pd.DataFrame())
+
+    def _download(self, symbols: list, period: str) -> dict:
+        """
+        Fetch several symbols from yfinance in a single batched request
+        
+        :param symbols: List of stock symbols
+        :param period: Time period for data
+        :return: Dictionary of non-empty DataFrames keyed by symbol
+        """
+        if not symbols:
+            return {}
+        
+        logger.info(f"Fetching {len(symbols)} symbols from yfinance")
         try:
-            # Calculate date range based on period
-            end_date = datetime.now()
-            if period == "3mo":
-                start_date = end_date - timedelta(days=90)
-            elif period == "1y":
-                start_date = end_date - timedelta(days=365)
+            raw = yf.download(symbols, period=period, group_by='ticker', threads=True,
+                              progress=False, auto_adjust=True)
+        except Exception as e:
+            logger.error(f"Error fetching data from yfinance: {str(e)}")
+            return {}
+        
+        if raw is None or raw.empty:
+            return {}
+        
+        fetched = {}
+        for symbol in symbols:
+            if isinstance(raw.columns, pd.MultiIndex):
+                if symbol not in raw.columns.get_level_values(0):
+                    continue
+                df = raw[symbol]
+            elif len(symbols) == 1:
+                df = raw
             else:
-                start_date = end_date - timedelta(days=90)  # default to 3mo
-            
-            # Try to get data from database first
-            if self.db.is_data_fresh(symbol):
-                df = self.db.get_stock_data(symbol, start_date, end_date)
-                if df is not None and not df.empty:
-                    logger.info(f"Retrieved {symbol} data from database")
-                    return df
-            
-            # If not in database or outdated, fetch from yfinance
-            logger.info(f"Fetching {symbol} data from yfinance")
-            stock = yf.Ticker(symbol)
-            df = stock.history(period=period)
+                # Flat columns from a multi-symbol request cannot be attributed to any one symbol
+                logger.warning(f"Unexpected column layout from yfinance, skipping {symbol}")
+                continue
             
-            # Save to database
+            # The batch index is the union of all trading days, so drop rows this symbol lacks
+            df = df.dropna(how='all')
             if not df.empty:
-                self.db.save_stock_data(symbol, df)
-                logger.info(f"Saved {symbol} data to database")
-            
-            return df
-            
-        except Exception as e:
-            logger.error(f"Error fetching data for {symbol}: {str(e)}")
-            return pd.DataFrame()  # Return empty DataFrame on error
+                fetched[symbol] = df
+        return fetched
 
     def get_multiple_stock_data(self, symbols: list, period: str = "3mo") -> dict:
         """
-        Get stock data for multiple symbols
+        Get stock data for multiple symbols. Symbols with fresh data in the local
+        database are read from it, the rest are fetched from yfinance in one batch.
         
         :param symbols: List of stock symbols
         :param period: Time period for data
         :return: Dictionary of DataFrames with stock data
         """
+        start_date, end_date = self._date_range(period)
+        
+        # Try to get data from database first
         data = {}
+        stale = []
         for symbol in symbols:
-            data[symbol] = self.get_stock_data(symbol, period)
-        return data
+            df, _ = self.db.fetch_if_fresh(symbol, start_date, end_date)
+            if df is not None and not df.empty:
+                logger.debug("Retrieved %s data from database", symbol)
+                data[symbol] = df
+            else:
+                stale.append(symbol)
+        logger.info("Retrieved %d/%d symbols from database", len(data), len(symbols))
+        
+        # If not in database or outdated, fetch from yfinance
+        fetched = self._download(stale, period)
+        if fetched:
+            try:
+                self.db.save_multiple_stock_data(fetched)
+            except Exception as e:
+                logger.error(f"Error saving fetched data: {str(e)}")
+        # Return fetched prices at the stored paise resolution, so a rerun that reads them back
+        # from the database computes the same indicators
+        data.update((symbol, as_stored(df)) for symbol, df in fetched.items())
+        
+        for symbol in stale:
+            if symbol not in fetched:
+                logger.error(f"No data available for {symbol}")
+        
+        # Return empty DataFrames for symbols that could not be fetched
+        return {symbol: data.get(symbol, pd.DataFrame()) for symbol in symbols}
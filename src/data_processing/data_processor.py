@@ -10,7 +10,6 @@ def process_stock_data(data):
     for symbol, df in data.items():
         # Basic data cleaning and processing
         df = df.dropna()
-        df['Returns'] = df['Close'].pct_change()
         processed_data[symbol] = df
 
     return processed_data
\ No newline at end of file
@@ -1,10 +1,86 @@
 import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 import logging
-from ..visualization.chart_generator import generate_stock_chart
+import numpy as np
+import pandas as pd
+from ..visualization.chart_generator import generate_stock_chart, find_current_chart
 
 logger = logging.getLogger(__name__)
 
+# Report sections and the signals listed under each
+CATEGORIES = {
+    'Buy Signals': ['Strong Buy', 'Buy'],
+    'Sell Signals': ['Sell'],
+    'Strong Sell Signals': ['Strong Sell']
+}
+
+# Report section of each listed signal
+_CATEGORY_OF = {signal: category for category, signal_types in CATEGORIES.items() for signal in signal_types}
+
+# Columns read from the last row of each signal frame; Close must come first
+_REPORT_COLUMNS = ['Close', 'Signal', 'RSI', 'MACD', 'Signal_Strength', 'SMA_20', 'SMA_50', 'Volume_Ratio']
+
+# One table row per stock, filled from a summary row plus its chart link
+_ROW_TMPL = (
+    "| **{Index}**<br>\n"
+    "Signal: {Signal}<br>\n"
+    "Price: ₹{Close:,.2f} ({Change:+.2f}%)<br>\n"
+    "RSI: {RSI:.2f}<br>\n"
+    "MACD: {MACD:.3f}<br>\n"
+    "Signal Strength: {Signal_Strength:.2f}<br>\n"
+    "SMA20: ₹{SMA_20:,.2f}<br>\n"
+    "SMA50: ₹{SMA_50:,.2f}<br>\n"
+    "Volume: {vol_trend} ({Volume_Ratio:.2f}x) | ![{Index} Chart]({chart}) |\n"
+)
+
+def _last_values(df):
+    """Return the previous close and a tuple of the current values of the report columns"""
+    # Scalar .iat reads per column; converting the columns to one mixed-dtype array would
+    # box the whole history just to keep its last two rows
+    close = df['Close']
+    current = (close.iat[-1], *(df[column].iat[-1] for column in _REPORT_COLUMNS[1:]))
+    return close.iat[-2], current
+
+def _summarize(signals):
+    """
+    Build one row per stock from the last two rows of its signal frame
+    :param signals: Dictionary of signal data for each stock
+    :return: DataFrame indexed by symbol with the report columns plus Prev_Close, Change and vol_trend
+    """
+    rows = {}
+    for symbol, df in signals.items():
+        if df is not None and not df.empty and symbol != '^NSEI':
+            prev_close, current = _last_values(df)
+            rows[symbol] = [*current, prev_close]
+    
+    summary = pd.DataFrame.from_dict(rows, orient='index', columns=_REPORT_COLUMNS + ['Prev_Close']).infer_objects()
+    summary['Change'] = ((summary['Close'] - summary['Prev_Close']) / summary['Prev_Close']) * 100
+    summary['vol_trend'] = np.select([summary['Volume_Ratio'] > 1.5, summary['Volume_Ratio'] < 0.5],
+                                     ['High', 'Low'], default='Normal')
+    return summary
+
+def _render_chart(task):
+    """Process pool entry point: render one (symbol, data, name, charts_dir) chart task"""
+    symbol, stock_data, name, charts_dir = task
+    return symbol, generate_stock_chart(stock_data, name, charts_dir)
+
+def _render_charts(tasks):
+    """
+    Render all chart tasks, fanning out across processes when more than one core is available
+    :param tasks: List of (symbol, data, name, charts_dir) tuples
+    :return: Dictionary of chart paths keyed by symbol
+    """
+    max_workers = min(len(tasks), os.cpu_count() or 1)
+    if max_workers <= 1:
+        return dict(map(_render_chart, tasks))
+    
+    # Spawn fresh workers so matplotlib state is never inherited from the parent process
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as executor:
+        return dict(executor.map(_render_chart, tasks))
+
 def generate_analysis_report(analyzed_data, signals):
     """
     Generate a detailed analysis report and save it to a file
@@ -19,113 +95,96 @@ def generate_analysis_report(analyzed_data, signals):
         os.makedirs(drafts_dir, exist_ok=True)
         os.makedirs(charts_dir, exist_ok=True)
         
+        # Charts always live in charts_dir, so the link prefix only has to be resolved once
+        relative_charts_dir = os.path.relpath(charts_dir, drafts_dir)
+        
         # Generate filename with current date
         current_date = datetime.now().strftime('%Y-%m-%d')
         filename = f'nifty50_analysis-{current_date}.md'
         filepath = os.path.join(drafts_dir, filename)
         
+        # Latest values of every stock, shared by the counts and the category tables
+        summary = _summarize(signals)
+        
         # Count signals
-        buy_signals = 0
-        sell_signals = 0
-        strong_sell_signals = 0
+        counts = summary['Signal'].value_counts()
+        buy_signals = int(counts.get('Strong Buy', 0) + counts.get('Buy', 0))
+        sell_signals = int(counts.get('Sell', 0))
+        strong_sell_signals = int(counts.get('Strong Sell', 0))
         
-        for symbol, df in signals.items():
-            if df is not None and not df.empty and symbol != '^NSEI':
-                signal = df['Signal'].iloc[-1]
-                if signal in ['Strong Buy', 'Buy']:
-                    buy_signals += 1
-                elif signal == 'Sell':
-                    sell_signals += 1
-                elif signal == 'Strong Sell':
-                    strong_sell_signals += 1
+        # Collect every chart the report will reference so they can be rendered in one batch
+        chart_tasks = []
+        if '^NSEI' in analyzed_data and '^NSEI' in signals and not signals['^NSEI'].empty:
+            chart_tasks.append(('^NSEI', analyzed_data['^NSEI'], 'NIFTY50', charts_dir))
         
-        report_content = ""
+        category_of = summary['Signal'].map(_CATEGORY_OF)
+        listed = summary.index[category_of.notna()]
+        chart_tasks.extend((symbol, analyzed_data[symbol], symbol, charts_dir) for symbol in listed)
+        
+        # Reuse charts already rendered from the same data and only render the rest
+        chart_paths = {}
+        stale_tasks = []
+        for task in chart_tasks:
+            symbol, stock_data, name, _ = task
+            chart_path = find_current_chart(stock_data, name, charts_dir)
+            if chart_path:
+                chart_paths[symbol] = chart_path
+            else:
+                stale_tasks.append(task)
+        chart_paths.update(_render_charts(stale_tasks))
+        
+        parts = []
         
         # Write header
-        report_content += "# Nifty 50 Technical Analysis Report\n\n"
-        report_content += f"*Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n\n"
+        parts.append("# Nifty 50 Technical Analysis Report\n\n")
+        parts.append(f"*Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n\n")
         
         # Add Nifty 50 Index Analysis if available
         if '^NSEI' in analyzed_data and '^NSEI' in signals:
             nifty_data = signals['^NSEI']
             if not nifty_data.empty:
-                current_value = nifty_data['Close'].iloc[-1]
-                prev_close = nifty_data['Close'].iloc[-2]
+                prev_close, current = _last_values(nifty_data)
+                current_value, signal, rsi, macd, signal_strength = current[:5]
                 change = ((current_value - prev_close) / prev_close) * 100
-                signal = nifty_data['Signal'].iloc[-1]
-                rsi = nifty_data['RSI'].iloc[-1]
-                macd = nifty_data['MACD'].iloc[-1]
-                signal_strength = nifty_data['Signal_Strength'].iloc[-1]
                 
-                report_content += "## Nifty 50 Index Overview\n\n"
-                report_content += f"- Current Value: **{current_value:,.2f}** ({change:+.2f}%)\n"
-                report_content += f"- Signal: **{signal}** (Strength: {signal_strength:.2f})\n"
-                report_content += f"- RSI: {rsi:.2f}\n"
-                report_content += f"- MACD: {macd:.3f}\n\n"
+                parts.append("## Nifty 50 Index Overview\n\n")
+                parts.append(f"- Current Value: **{current_value:,.2f}** ({change:+.2f}%)\n")
+                parts.append(f"- Signal: **{signal}** (Strength: {signal_strength:.2f})\n")
+                parts.append(f"- RSI: {rsi:.2f}\n")
+                parts.append(f"- MACD: {macd:.3f}\n\n")
                 
-                # Generate and add index chart
-                chart_path = generate_stock_chart(analyzed_data['^NSEI'], 'NIFTY50', charts_dir)
-                relative_chart_path = os.path.relpath(chart_path, drafts_dir)
-                report_content += f"![Nifty 50 Chart]({relative_chart_path})\n\n"
+                # Add index chart
+                relative_chart_path = f"{relative_charts_dir}/{os.path.basename(chart_paths['^NSEI'])}"
+                parts.append(f"![Nifty 50 Chart]({relative_chart_path})\n\n")
         
         # Write market summary
-        report_content += "## Market Analysis Summary\n\n"
-        report_content += f"- Strong Buy/Buy Signals: **{buy_signals} stocks**\n"
-        report_content += f"- Sell Signals: **{sell_signals} stocks**\n"
-        report_content += f"- Strong Sell Signals: **{strong_sell_signals} stocks**\n\n"
+        parts.append("## Market Analysis Summary\n\n")
+        parts.append(f"- Strong Buy/Buy Signals: **{buy_signals} stocks**\n")
+        parts.append(f"- Sell Signals: **{sell_signals} stocks**\n")
+        parts.append(f"- Strong Sell Signals: **{strong_sell_signals} stocks**\n\n")
         
         # Add table header for two-column layout
-        report_content += "## Detailed Stock Analysis\n\n"
-        report_content += "| Stock Analysis | Technical Chart |\n"
-        report_content += "|----------------|------------------|\n"
+        parts.append("## Detailed Stock Analysis\n\n")
+        parts.append("| Stock Analysis | Technical Chart |\n")
+        parts.append("|----------------|------------------|\n")
         
-        # Process stocks by signal category
-        categories = {
-            'Buy Signals': ['Strong Buy', 'Buy'],
-            'Sell Signals': ['Sell'],
-            'Strong Sell Signals': ['Strong Sell']
-        }
-        
-        for category, signal_types in categories.items():
-            report_content += f"\n### {category}\n\n"
+        # Process stocks by signal category; every section header is written even when it has no stocks
+        groups = dict(tuple(summary.groupby(category_of, sort=False)))
+        for category in CATEGORIES:
+            parts.append(f"\n### {category}\n\n")
             
-            for symbol, df in signals.items():
-                if df is not None and not df.empty and symbol != '^NSEI':
-                    signal = df['Signal'].iloc[-1]
-                    if signal in signal_types:
-                        # Generate chart
-                        chart_path = generate_stock_chart(analyzed_data[symbol], symbol, charts_dir)
-                        relative_chart_path = os.path.relpath(chart_path, drafts_dir)
-                        
-                        # Format stock info
-                        current_price = df['Close'].iloc[-1]
-                        prev_close = df['Close'].iloc[-2]
-                        price_change = ((current_price - prev_close) / prev_close) * 100
-                        rsi = df['RSI'].iloc[-1]
-                        macd = df['MACD'].iloc[-1]
-                        signal_strength = df['Signal_Strength'].iloc[-1]
-                        sma_20 = df['SMA_20'].iloc[-1]
-                        sma_50 = df['SMA_50'].iloc[-1]
-                        vol_ratio = df['Volume_Ratio'].iloc[-1]
-                        vol_trend = "High" if vol_ratio > 1.5 else "Low" if vol_ratio < 0.5 else "Normal"
-                        
-                        stock_info = (
-                            f"**{symbol}**<br>\n"
-                            f"Signal: {signal}<br>\n"
-                            f"Price: ₹{current_price:,.2f} ({price_change:+.2f}%)<br>\n"
-                            f"RSI: {rsi:.2f}<br>\n"
-                            f"MACD: {macd:.3f}<br>\n"
-                            f"Signal Strength: {signal_strength:.2f}<br>\n"
-                            f"SMA20: ₹{sma_20:,.2f}<br>\n"
-                            f"SMA50: ₹{sma_50:,.2f}<br>\n"
-                            f"Volume: {vol_trend} ({vol_ratio:.2f}x)"
-                        )
-                        
-                        # Add to table
-                        report_content += f"| {stock_info} | ![{symbol} Chart]({relative_chart_path}) |\n"
+            if category not in groups:
+                continue
+            for row in groups[category].itertuples():
+                fields = row._asdict()
+                fields['chart'] = f"{relative_charts_dir}/{os.path.basename(chart_paths[row.Index])}"
+                
+                # Add to table
+                parts.append(_ROW_TMPL.format_map(fields))
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(report_content)
+        # Write the pieces straight through a 1 MiB buffer instead of joining them into one string first
+        with open(filepath, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.writelines(parts)
         
         logger.info(f"Analysis report generated successfully: {filepath}")
         return filepath
@@ -1,3 +1,3 @@
-from .chart_generator import generate_stock_chart
+from .chart_generator import generate_stock_chart, find_current_chart
 
-__all__ = ['generate_stock_chart']
+__all__ = ['generate_stock_chart', 'find_current_chart']
@@ -1,111 +1,215 @@
-import mplfinance as mpf
 import pandas as pd
+import numpy as np
 import os
-import matplotlib.pyplot as plt
+import hashlib
+from functools import lru_cache
+from PIL import Image
+
+# Bump when the chart layout changes so existing charts are re-rendered
+CHART_VERSION = '5'
+
+# Columns that can appear on the chart
+CHART_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume', 'RSI', 'MACD', 'MACD_Signal', 'MACD_Hist',
+                 'BB_Upper', 'BB_Lower', 'BB_Mid', 'SMA_20', 'SMA_50']
+
+def _chart_file(symbol, output_dir):
+    return os.path.join(output_dir, f'{symbol}_technical_analysis.png')
+
+def _fingerprint(stock_data, symbol):
+    """Hash of everything drawn on the chart, stored in the PNG so unchanged charts can be reused"""
+    available = set(stock_data.columns)
+    columns = [column for column in CHART_COLUMNS if column in available]
+    digest = hashlib.sha1(f'{CHART_VERSION}:{symbol}:{columns}'.encode())
+    digest.update(pd.util.hash_pandas_object(stock_data[columns]).to_numpy().tobytes())
+    return digest.hexdigest()
+
+def find_current_chart(stock_data, symbol, output_dir):
+    """
+    Return the path of an existing chart for symbol if it was rendered from
+    exactly this data, otherwise None
+    """
+    output_file = _chart_file(symbol, output_dir)
+    try:
+        with Image.open(output_file) as image:
+            if image.info.get('Fingerprint') == _fingerprint(stock_data, symbol):
+                return output_file
+    except (OSError, ValueError):
+        pass
+    return None
+
+# Colours of mplfinance's 'charles' style, which the charts were originally drawn with
+_CANDLE_COLORS = ('#006340', '#a02128')
+_VOLUME_COLORS = ('#007a00', '#d50d18')
+
+# Custom style settings
+_STYLE = {
+    'font.size': 8,
+    'axes.titlesize': 10,
+    'figure.titlesize': 10,
+    'figure.titleweight': 'bold',
+    'axes.labelsize': 8,
+    'axes.labelweight': 'bold',
+    'xtick.labelsize': 8,
+    'ytick.labelsize': 8,
+    'axes.linewidth': 0.5,
+    'axes.spines.top': False,
+    'axes.spines.right': False,
+    'axes.grid': True,
+    'grid.linestyle': ':',
+    'grid.color': 'gray',
+    'grid.linewidth': 0.5,
+    'grid.alpha': 0.2,
+}
+
+# Indicator overlays as (required columns, panel, y label, reference lines, series), where panel
+# indexes the (price, volume, RSI, MACD) axes and each series is (column, bar?, style)
+_INDICATORS = (
+    (('BB_Upper', 'BB_Lower', 'BB_Mid'), 0, None, (), (
+        ('BB_Upper', False, dict(color='gray', alpha=0.3)),
+        ('BB_Lower', False, dict(color='gray', alpha=0.3)),
+        ('BB_Mid', False, dict(color='blue', alpha=0.3)),
+    )),
+    (('SMA_20',), 0, None, (), (('SMA_20', False, dict(color='blue', linewidth=0.7, alpha=0.7)),)),
+    (('SMA_50',), 0, None, (), (('SMA_50', False, dict(color='red', linewidth=0.7, alpha=0.7)),)),
+    (('RSI',), 2, 'RSI', (30, 70), (('RSI', False, dict(color='purple', linewidth=0.7)),)),
+    (('MACD', 'MACD_Signal', 'MACD_Hist'), 3, 'MACD', (), (
+        ('MACD', False, dict(color='blue', linewidth=0.7)),
+        ('MACD_Signal', False, dict(color='orange', linewidth=0.7)),
+        ('MACD_Hist', True, dict(width=0.7, color='dimgray', alpha=0.3)),
+    )),
+)
+
+# Style of the RSI reference lines
+_REFERENCE_LINE_STYLE = dict(color='gray', linestyle='--', alpha=0.3)
+
+# 120 DPI is plenty for a chart embedded in a markdown report; zlib level 1 encodes several
+# times faster than the default level 6 for only slightly larger files
+_SAVE_KWARGS = dict(bbox_inches='tight', dpi=120, pad_inches=0.2, pil_kwargs={'compress_level': 1})
+
+@lru_cache(maxsize=32)
+def _indicators_for(columns):
+    """Indicator overlays that can be drawn from columns; every stock shares one schema, so this is resolved once"""
+    return tuple(indicator for indicator in _INDICATORS if columns.issuperset(indicator[0]))
+
+def _draw_bars(ax, x, height, width, color, bottom=0.0, alpha=None):
+    """
+    Draw bars as a single PolyCollection whose vertices are built from the
+    x/bottom/height arrays, instead of one Rectangle artist per bar
+    """
+    from matplotlib.collections import PolyCollection
+    
+    # Like ax.bar, bars rising from a common baseline keep it at the edge of the axis instead of padding below it
+    sticky = [float(bottom)] if np.ndim(bottom) == 0 else []
+    height = np.asarray(height, dtype=float)
+    bottom = np.broadcast_to(np.asarray(bottom, dtype=float), height.shape)
+    top = bottom + height
+    left = x - width / 2
+    right = x + width / 2
+    
+    # Bars without a value (indicator warm-up) are simply not drawn
+    valid = np.isfinite(top) & np.isfinite(bottom)
+    color = np.broadcast_to(np.asarray(color), height.shape)[valid]
+    verts = np.stack([
+        np.column_stack([left, bottom]), np.column_stack([left, top]),
+        np.column_stack([right, top]), np.column_stack([right, bottom]),
+    ], axis=1)[valid]
+    
+    bars = PolyCollection(verts, facecolors=color, edgecolors='none', alpha=alpha)
+    bars.sticky_edges.y.extend(sticky)
+    ax.add_collection(bars)
+    ax.autoscale_view()
+    return bars
+
+# Figure and (price, volume, RSI, MACD) axes reused by every chart rendered in this process
+_figure = None
+_axes = None
+
+def _get_figure():
+    """Create the chart figure on first use; later charts clear and redraw its axes"""
+    global _figure, _axes
+    if _figure is None:
+        # matplotlib is imported on first use so importing this module stays cheap
+        from matplotlib import rc_context
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        
+        with rc_context(_STYLE):
+            _figure = Figure(figsize=(12, 8))
+            FigureCanvasAgg(_figure)
+            _axes = _figure.subplots(4, 1, sharex=True, gridspec_kw={'height_ratios': (6, 2, 2, 2)})
+            _figure.subplots_adjust(left=0.07, right=0.97, top=0.94, bottom=0.08, hspace=0.08)
+    return _figure, _axes
 
 def generate_stock_chart(stock_data, symbol, output_dir):
     """
     Generate a technical analysis chart for a given stock.
     
+    Charts are drawn on a figure shared by the whole process, so this is not
+    safe to call from several threads at once; use processes to render in parallel.
+    
     Args:
         stock_data (pd.DataFrame): OHLCV data with technical indicators
         symbol (str): Stock symbol
         output_dir (str): Directory to save the chart
     """
+    from matplotlib import rc_context
+    from matplotlib.ticker import FuncFormatter, MaxNLocator
+    
     # Ensure the output directory exists
     os.makedirs(output_dir, exist_ok=True)
     
-    # Create a copy of the data to avoid modifications to original
-    df = stock_data.copy()
-    
-    # Convert index to datetime if not already
-    if not isinstance(df.index, pd.DatetimeIndex):
-        df.index = pd.to_datetime(df.index)
-    
-    # Prepare additional plots
-    additional_plots = []
-    
-    # Add RSI with reference lines
-    if 'RSI' in df.columns:
-        # Add RSI line
-        additional_plots.append(
-            mpf.make_addplot(df['RSI'], panel=2, ylabel='RSI',
-                           color='purple', width=0.7)
-        )
-        # Add RSI reference lines (30 and 70)
-        rsi_length = len(df)
-        additional_plots.extend([
-            mpf.make_addplot([30] * rsi_length, panel=2, color='gray', linestyle='--', alpha=0.3),
-            mpf.make_addplot([70] * rsi_length, panel=2, color='gray', linestyle='--', alpha=0.3)
-        ])
-    
-    # Add MACD
-    if all(x in df.columns for x in ['MACD', 'MACD_Signal', 'MACD_Hist']):
-        additional_plots.extend([
-            mpf.make_addplot(df['MACD'], panel=3, color='blue', ylabel='MACD', width=0.7),
-            mpf.make_addplot(df['MACD_Signal'], panel=3, color='orange', width=0.7),
-            mpf.make_addplot(df['MACD_Hist'], type='bar', panel=3, color='dimgray', alpha=0.3, width=0.7)
-        ])
-    
-    # Add Bollinger Bands
-    if all(x in df.columns for x in ['BB_Upper', 'BB_Lower', 'BB_Mid']):
-        additional_plots.extend([
-            mpf.make_addplot(df['BB_Upper'], color='gray', alpha=0.3),
-            mpf.make_addplot(df['BB_Lower'], color='gray', alpha=0.3),
-            mpf.make_addplot(df['BB_Mid'], color='blue', alpha=0.3)
-        ])
-    
-    # Add SMAs
-    if 'SMA_20' in df.columns:
-        additional_plots.append(
-            mpf.make_addplot(df['SMA_20'], color='blue', width=0.7, alpha=0.7)
-        )
-    if 'SMA_50' in df.columns:
-        additional_plots.append(
-            mpf.make_addplot(df['SMA_50'], color='red', width=0.7, alpha=0.7)
-        )
-
-    # Custom style settings
-    style = mpf.make_mpf_style(
-        base_mpf_style='charles',
-        gridstyle=':',
-        y_on_right=False,
-        gridcolor='gray',
-        rc={
-            'font.size': 8,
-            'axes.titlesize': 10,
-            'axes.labelsize': 8,
-            'xtick.labelsize': 8,
-            'ytick.labelsize': 8,
-            'axes.linewidth': 0.5,
-            'grid.linewidth': 0.5,
-            'grid.alpha': 0.2,
-        }
-    )
-    
-    # Figure size and layout settings
-    kwargs = dict(
-        figsize=(12, 8),
-        figratio=(16,9),
-        panel_ratios=(6,2,2,2),  # Adjusted panel ratios
-        type='candle',
-        volume=True,
-        addplot=additional_plots,
-        style=style,
-        title=f'\n{symbol} Technical Analysis\n',
-        returnfig=True,
-        tight_layout=True,
-        volume_panel=1,
-        scale_padding=0.2,
-        scale_width_adjustment=dict(candle=0.8, volume=0.7),
-    )
+    # The data is only read, so it is plotted as is
+    df = stock_data
     
-    # Create the chart
-    fig, axes = mpf.plot(df, **kwargs)
+    # Bars are drawn at integer positions so non-trading days leave no gaps
+    x = np.arange(len(df))
+    open_, high, low, close, volume = (df[column].to_numpy() for column in ['Open', 'High', 'Low', 'Close', 'Volume'])
+    up_color, down_color = _CANDLE_COLORS
+    candle_colors = np.where(close >= open_, up_color, down_color)
+    up_color, down_color = _VOLUME_COLORS
+    volume_colors = np.where(np.diff(close, prepend=close[:1]) >= 0, up_color, down_color)
     
-    # Save the chart with high DPI for better quality
-    output_file = os.path.join(output_dir, f'{symbol}_technical_analysis.png')
-    plt.savefig(output_file, bbox_inches='tight', dpi=300, pad_inches=0.2)
-    plt.close(fig)
+    fig, (ax_price, ax_volume, ax_rsi, ax_macd) = _get_figure()
+    with rc_context(_STYLE):
+        for ax in (ax_price, ax_volume, ax_rsi, ax_macd):
+            ax.clear()
+        
+        # Candles
+        ax_price.vlines(x, low, high, colors=candle_colors, linewidth=0.8)
+        _draw_bars(ax_price, x, np.abs(close - open_), 0.8, candle_colors, bottom=np.minimum(open_, close))
+        ax_price.set_ylabel('Price')
+        
+        # Volume
+        _draw_bars(ax_volume, x, volume, 0.7, volume_colors)
+        ax_volume.set_ylabel('Volume')
+        
+        # Indicator overlays
+        axes = (ax_price, ax_volume, ax_rsi, ax_macd)
+        for _, panel, ylabel, reference_lines, series in _indicators_for(frozenset(df.columns)):
+            ax = axes[panel]
+            for column, is_bar, style in series:
+                if is_bar:
+                    _draw_bars(ax, x, df[column].to_numpy(), **style)
+                else:
+                    ax.plot(x, df[column].to_numpy(), **style)
+            for level in reference_lines:
+                ax.axhline(level, **_REFERENCE_LINE_STYLE)
+            if ylabel:
+                ax.set_ylabel(ylabel)
+        
+        # Date labels along the shared x axis
+        dates = df.index
+        ax_macd.set_xlim(-1, len(df))
+        ax_macd.xaxis.set_major_locator(MaxNLocator(nbins=8, integer=True))
+        # Only the labelled positions are converted, so a non-datetime index needs no up-front coercion
+        ax_macd.xaxis.set_major_formatter(FuncFormatter(
+            lambda value, _: pd.Timestamp(dates[int(value)]).strftime('%b %d') if 0 <= value < len(dates) else ''))
+        for ax in (ax_price, ax_volume, ax_rsi):
+            ax.tick_params(labelbottom=False)
+        ax_macd.tick_params(axis='x', labelrotation=45)
+        fig.suptitle(f'{symbol} Technical Analysis')
+        
+        output_file = _chart_file(symbol, output_dir)
+        fig.savefig(output_file, metadata={'Fingerprint': _fingerprint(stock_data, symbol)}, **_SAVE_KWARGS)
     
     return output_file
@@ -0,0 +1,94 @@
+import sqlite3
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data_collection import db_manager, stock_data
+from src.data_collection.db_manager import DatabaseManager
+from src.data_collection.stock_data import StockDataCollector
+
+SYMBOLS = ['A.NS', 'BB.NS']
+
+def make_db(path):
+    """DatabaseManager backed by a database file at path instead of the project data directory"""
+    db = DatabaseManager.__new__(DatabaseManager)
+    db.db_dir = str(path.parent)
+    db.db_path = str(path)
+    db._init_db()
+    return db
+
+def make_collector(path):
+    collector = StockDataCollector.__new__(StockDataCollector)
+    collector.db = make_db(path)
+    return collector
+
+@pytest.fixture
+def db_path(tmp_path):
+    db_manager._read_symbol.cache_clear()
+    yield tmp_path / 'stock_data.db'
+    db_manager._read_symbol.cache_clear()
+
+@pytest.fixture
+def downloads(monkeypatch):
+    """Patch yf.download with a batched response of sub-paisa prices and float volumes"""
+    calls = []
+
+    def fake_download(tickers, **kwargs):
+        calls.append(list(tickers))
+        index = pd.date_range(end=pd.Timestamp.today().normalize(), periods=60, freq='D', name='Date')
+        frames = {}
+        for i, ticker in enumerate(tickers):
+            rng = np.random.default_rng(i)
+            close = 100 + np.cumsum(rng.normal(size=len(index)))
+            frames[ticker] = pd.DataFrame({
+                'Open': close + 0.123456, 'High': close + 1.0003, 'Low': close - 0.9996, 'Close': close,
+                'Volume': rng.integers(1, 1000, len(index)).astype(float),
+            }, index=index)
+        return pd.concat(frames, axis=1)
+
+    monkeypatch.setattr(stock_data.yf, 'download', fake_download)
+    return calls
+
+def test_downloaded_frames_match_database_reads(db_path, downloads):
+    first = make_collector(db_path).get_multiple_stock_data(SYMBOLS)
+    second = make_collector(db_path).get_multiple_stock_data(SYMBOLS)
+
+    # The second run is served entirely from the database
+    assert downloads == [SYMBOLS]
+    assert sorted(first) == sorted(second) == sorted(SYMBOLS)
+    for symbol in SYMBOLS:
+        pd.testing.assert_frame_equal(first[symbol], second[symbol])
+        prices = first[symbol][['Open', 'High', 'Low', 'Close']].to_numpy()
+        np.testing.assert_array_equal(prices, np.rint(prices * db_manager.PRICE_SCALE) / db_manager.PRICE_SCALE)
+
+@pytest.mark.parametrize('schema', [
+    # Written by DataFrame.to_sql: no primary key
+    'CREATE TABLE stock_data (symbol TEXT, date TEXT, open REAL, high REAL, low REAL, close REAL, '
+    'volume INTEGER, last_updated TIMESTAMP)',
+    # Prices stored as REAL rupees rather than integer paise
+    'CREATE TABLE stock_data (symbol TEXT, date DATE, open REAL, high REAL, low REAL, close REAL, '
+    'volume INTEGER, last_updated TIMESTAMP, PRIMARY KEY (symbol, date))',
+])
+def test_older_schema_is_recreated(db_path, schema):
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(schema)
+        conn.execute("INSERT INTO stock_data VALUES ('A.NS', '2024-01-01', 1.5, 2.5, 0.5, 1.25, 10, "
+                     "'2024-01-01 00:00:00.000000')")
+
+    make_db(db_path)
+
+    with sqlite3.connect(db_path) as conn:
+        columns = conn.execute("PRAGMA table_info(stock_data)").fetchall()
+        rows = conn.execute("SELECT COUNT(*) FROM stock_data").fetchone()[0]
+    column_types = {column[1]: column[2] for column in columns}
+    assert column_types['close'] == 'INTEGER'
+    assert [column[1] for column in columns if column[5]] == ['symbol', 'date']
+    assert rows == 0
+
+def test_current_schema_is_kept(db_path, downloads):
+    make_collector(db_path).get_multiple_stock_data(SYMBOLS)
+    make_db(db_path)
+
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("SELECT COUNT(DISTINCT symbol) FROM stock_data").fetchone()[0] == len(SYMBOLS)
@@ -0,0 +1,73 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analysis.indicator_cache import IndicatorCache
+from src.analysis.technical_indicators import INDICATOR_VERSION
+
+def make_prices(n=30):
+    rng = np.random.default_rng(0)
+    close = 100 + np.cumsum(rng.normal(size=n))
+    return pd.DataFrame({
+        'Open': close, 'High': close + 1, 'Low': close - 1, 'Close': close,
+        'Volume': rng.integers(1, 1000, n),
+    }, index=pd.date_range('2024-01-01', periods=n, freq='B', name='date'))
+
+def make_result(data):
+    """Stand-in for an indicator frame: the input columns plus a derived one"""
+    result = data.copy()
+    result['SMA_5'] = data['Close'].rolling(5).mean()
+    return result
+
+@pytest.fixture
+def cache(tmp_path):
+    return IndicatorCache(INDICATOR_VERSION, cache_dir=str(tmp_path))
+
+def test_snapshot_is_reused_on_exact_match(cache):
+    data = make_prices()
+    result = make_result(data)
+    cache.save('A.NS', data, result)
+
+    pd.testing.assert_frame_equal(cache.load('A.NS', data.copy()), result)
+
+def test_snapshot_of_other_version_is_not_loaded(cache, tmp_path):
+    data = make_prices()
+    IndicatorCache(INDICATOR_VERSION + '-old', cache_dir=str(tmp_path)).save('A.NS', data, make_result(data))
+
+    assert cache.load('A.NS', data) is None
+
+def test_snapshot_is_rejected_when_input_columns_differ(cache):
+    data = make_prices()
+    cache.save('A.NS', data, make_result(data))
+
+    with_returns = data.copy()
+    with_returns['Returns'] = data['Close'].pct_change()
+    assert cache.load('A.NS', with_returns) is None
+    assert cache.load('A.NS', data[['Close', 'Open', 'High', 'Low', 'Volume']]) is None
+
+def test_snapshot_is_rejected_when_a_close_changes(cache):
+    data = make_prices()
+    cache.save('A.NS', data, make_result(data))
+
+    changed = data.copy()
+    changed.iloc[len(changed) // 2, changed.columns.get_loc('Close')] += 0.01
+    assert cache.load('A.NS', changed) is None
+
+def test_evict_removes_other_versions_and_oldest_entries(tmp_path):
+    data = make_prices()
+    result = make_result(data)
+    IndicatorCache(INDICATOR_VERSION + '-old', cache_dir=str(tmp_path)).save('OLD.NS', data, result)
+
+    cache = IndicatorCache(INDICATOR_VERSION, max_entries=2, cache_dir=str(tmp_path))
+    for age, symbol in enumerate(['NEW.NS', 'MID.NS', 'STALE.NS']):
+        cache.save(symbol, data, result)
+        mtime = 1_700_000_000 - age * 60
+        os.utime(cache._path(symbol), (mtime, mtime))
+
+    cache.evict()
+
+    assert sorted(os.listdir(tmp_path)) == sorted(
+        os.path.basename(cache._path(symbol)) for symbol in ['NEW.NS', 'MID.NS']
+    )
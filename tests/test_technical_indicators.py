@@ -0,0 +1,94 @@
+import numpy as np
+import pandas as pd
+import pytest
+from ta.trend import MACD, SMAIndicator, EMAIndicator, ADXIndicator
+from ta.momentum import RSIIndicator
+from ta.volatility import BollingerBands, AverageTrueRange
+from ta.volume import OnBalanceVolumeIndicator, ChaikinMoneyFlowIndicator
+
+from src.analysis.technical_indicators import (
+    calculate_custom_indicators,
+    get_signal_strength,
+    _signal_strength_kernel,
+    _signal_strength_vectorized,
+    _column,
+)
+
+RTOL = 1e-10
+
+# Signal strength inputs, in the order the array implementations take them
+STRENGTH_COLUMNS = ['Close', 'SMA_20', 'SMA_50', 'ADX', 'DI_plus', 'DI_minus', 'RSI', 'MACD', 'MACD_Signal',
+                    'VI_plus', 'VI_minus', 'Volume_Ratio', 'CMF', 'S1', 'R1', 'ATR']
+
+def make_ohlcv(seed, n=250):
+    """Seeded random-walk OHLCV history with flat bars and runs of repeated closes"""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+    high = close * (1 + rng.uniform(0, 0.03, n))
+    low = close * (1 - rng.uniform(0, 0.03, n))
+    open_ = low + (high - low) * rng.uniform(size=n)
+    volume = rng.integers(100_000, 10_000_000, n)
+    
+    # Repeated closes: unchanged price from one bar to the next
+    repeated = rng.choice(np.arange(1, n), size=n // 10, replace=False)
+    close[repeated] = close[repeated - 1]
+    high[repeated] = np.maximum(high[repeated], close[repeated])
+    low[repeated] = np.minimum(low[repeated], close[repeated])
+    
+    # Flat bars: open, high, low and close all equal
+    flat = rng.choice(np.arange(n), size=n // 20, replace=False)
+    open_[flat] = high[flat] = low[flat] = close[flat]
+    
+    index = pd.date_range('2024-01-01', periods=n, freq='B')
+    return pd.DataFrame({'Open': open_, 'High': high, 'Low': low, 'Close': close, 'Volume': volume},
+                        index=index)
+
+def ta_reference(df):
+    """The indicators as the ta library computes them"""
+    high, low, close, volume = df['High'], df['Low'], df['Close'], df['Volume']
+    macd = MACD(close=close)
+    adx = ADXIndicator(high=high, low=low, close=close)
+    bb = BollingerBands(close=close)
+    return {
+        'SMA_20': SMAIndicator(close=close, window=20).sma_indicator(),
+        'SMA_50': SMAIndicator(close=close, window=50).sma_indicator(),
+        'EMA_20': EMAIndicator(close=close, window=20).ema_indicator(),
+        'EMA_50': EMAIndicator(close=close, window=50).ema_indicator(),
+        'RSI': RSIIndicator(close=close).rsi(),
+        'MACD': macd.macd(),
+        'MACD_Signal': macd.macd_signal(),
+        'MACD_Hist': macd.macd_diff(),
+        'ADX': adx.adx(),
+        'DI_plus': adx.adx_pos(),
+        'DI_minus': adx.adx_neg(),
+        'BB_Upper': bb.bollinger_hband(),
+        'BB_Lower': bb.bollinger_lband(),
+        'BB_Mid': bb.bollinger_mavg(),
+        'ATR': AverageTrueRange(high=high, low=low, close=close).average_true_range(),
+        'OBV': OnBalanceVolumeIndicator(close=close, volume=volume).on_balance_volume(),
+        'CMF': ChaikinMoneyFlowIndicator(high=high, low=low, close=close, volume=volume).chaikin_money_flow(),
+        'Volume_MA': volume.rolling(window=20).mean(),
+    }
+
+@pytest.mark.parametrize('seed', range(10))
+def test_indicators_match_ta(seed):
+    df = make_ohlcv(seed)
+    result = calculate_custom_indicators(df)
+    for column, expected in ta_reference(df).items():
+        assert np.allclose(result[column].to_numpy(dtype=np.float64), expected.to_numpy(dtype=np.float64),
+                           rtol=RTOL, equal_nan=True), column
+
+def test_input_frame_is_not_modified():
+    df = make_ohlcv(0)
+    original = df.copy()
+    calculate_custom_indicators(df)
+    pd.testing.assert_frame_equal(df, original)
+
+@pytest.mark.parametrize('seed', range(5))
+def test_signal_strength_matches_row_reference(seed):
+    df = calculate_custom_indicators(make_ohlcv(seed))
+    expected = df.apply(get_signal_strength, axis=1).to_numpy()
+    columns = [_column(df, name) for name in STRENGTH_COLUMNS]
+    for implementation in (_signal_strength_kernel, _signal_strength_vectorized):
+        np.testing.assert_allclose(implementation(*columns), expected, rtol=1e-12,
+                                   err_msg=implementation.__name__)